@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 import posixpath
 import re
 from pathlib import Path
@@ -14,14 +15,56 @@ try:
 except ImportError as exc:  # pragma: no cover - runtime dependency check
     raise SystemExit("Missing dependency: beautifulsoup4. Install with: python -m pip install beautifulsoup4") from exc
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional speedup
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 POSTS_JSON_PATH = ROOT_DIR / "data" / "posts.json"
 REPORT_PATH = ROOT_DIR / "blog-normalize-report.json"
 
-SIZE_SUFFIX_RE = re.compile(r"-\d+x\d+(?=\.[a-z0-9]+$)", re.IGNORECASE)
-SCALED_SUFFIX_RE = re.compile(r"-(scaled|rotated)(?=\.[a-z0-9]+$)", re.IGNORECASE)
-HASH_SUFFIX_RE = re.compile(r"-[a-z0-9]{12,}(?=\.[a-z0-9]+$)", re.IGNORECASE)
+FILENAME_SUFFIX_RE = re.compile(
+    r"(?:-\d+x\d+|-(?:scaled|rotated)|-[a-z0-9]{12,})+(?=\.[a-z0-9]+$)",
+    re.IGNORECASE,
+)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Publish data under path via tmp file + os.replace so readers never see torn writes."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def dump_json_bytes(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def parse_fragment(html_text: str) -> BeautifulSoup:
+    """Parse an HTML fragment; lxml wraps fragments in html/head/body, so unwrap those."""
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+    if HTML_PARSER != "html.parser":
+        for wrapper_name in ("head", "body", "html"):
+            wrapper = getattr(soup, wrapper_name)
+            if wrapper is not None:
+                wrapper.unwrap()
+    return soup
 
 
 def normalize_src(src: str) -> str:
@@ -50,11 +93,7 @@ def normalize_src(src: str) -> str:
 
     if path:
         parts = path.split("/")
-        filename = parts[-1]
-        filename = SIZE_SUFFIX_RE.sub("", filename)
-        filename = SCALED_SUFFIX_RE.sub("", filename)
-        filename = HASH_SUFFIX_RE.sub("", filename)
-        parts[-1] = filename
+        parts[-1] = FILENAME_SUFFIX_RE.sub("", parts[-1])
         path = "/".join(parts)
 
     return path.lower()
@@ -121,7 +160,7 @@ def normalize_post(post: dict[str, object]) -> tuple[str, int, int, bool, list[s
     if not cover_path:
         warnings.append(f"{slug}: missing coverImagePath")
 
-    soup = BeautifulSoup(content_html, "html.parser")
+    soup = parse_fragment(content_html)
     cover_norm = normalize_src(cover_path)
 
     removed_duplicates = 0
@@ -180,10 +219,7 @@ def main() -> None:
             changed_slugs.append(slug)
         warnings.extend(post_warnings)
 
-    POSTS_JSON_PATH.write_text(
-        json.dumps(posts, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    atomic_write_bytes(POSTS_JSON_PATH, dump_json_bytes(posts))
 
     report = {
         "totalPosts": len(posts),
@@ -192,7 +228,7 @@ def main() -> None:
         "postsWithChanges": changed_slugs,
         "warnings": warnings,
     }
-    REPORT_PATH.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    atomic_write_bytes(REPORT_PATH, dump_json_bytes(report))
 
 
 if __name__ == "__main__":
@@ -4,19 +4,47 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import html
 import json
+import os
 import re
 import shutil
-import ssl
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
-from urllib.request import Request, urlopen
 from xml.etree import ElementTree as ET
 
+try:
+    from bs4 import BeautifulSoup
+    from bs4.element import Comment, Tag
+except ImportError as exc:  # pragma: no cover - runtime dependency check
+    raise SystemExit("Missing dependency: beautifulsoup4. Install with: python -m pip install beautifulsoup4") from exc
+
+try:
+    import urllib3
+except ImportError as exc:  # pragma: no cover - runtime dependency check
+    raise SystemExit("Missing dependency: urllib3. Install with: python -m pip install urllib3") from exc
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional speedup
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
 
 BASE_URL = "https://www.fcgestaoestrategica.com.br"
 BLOG_INDEX = f"{BASE_URL}/blog/"
@@ -24,15 +52,21 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 BLOG_HTML_PATH = ROOT_DIR / "blog.html"
 POSTS_JSON_PATH = ROOT_DIR / "data" / "posts.json"
 ASSETS_DIR = ROOT_DIR / "assets" / "blog"
+SPA_JS_PATH = ROOT_DIR / "assets" / "blog-spa.js"
 REPORT_PATH = ROOT_DIR / "blog-singlepage-report.json"
 SITEMAP_PATH = ROOT_DIR / "sitemap.xml"
+HTML_CACHE_DIR = ROOT_DIR / ".cache" / "html"
+ASSET_META_DIR = ROOT_DIR / ".cache" / "asset-meta"
+
+POST_CACHE_TTL = 24 * 3600
+INDEX_CACHE_TTL = 3600
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
     "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
 }
 
-EXCLUDE_SLUGS = {
+EXCLUDE_SLUGS = frozenset({
     "",
     "blog",
     "contato",
@@ -48,7 +82,7 @@ EXCLUDE_SLUGS = {
     "category",
     "tag",
     "author",
-}
+})
 
 MONTHS_PT = {
     "janeiro": 1,
@@ -66,32 +100,142 @@ MONTHS_PT = {
     "dezembro": 12,
 }
 
-SSL_CONTEXT = ssl._create_unverified_context()
+MONTHS_PT_LIST = (
+    "janeiro",
+    "fevereiro",
+    "março",
+    "abril",
+    "maio",
+    "junho",
+    "julho",
+    "agosto",
+    "setembro",
+    "outubro",
+    "novembro",
+    "dezembro",
+)
+
+FETCH_WORKERS = 16
+IMAGE_WORKERS = 8
+
+TODAY_ISO = date.today().isoformat()
+
+urllib3.disable_warnings()
+
+REPORT_LOCK = threading.Lock()
+IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
+
+POOL = urllib3.PoolManager(
+    maxsize=32,
+    cert_reqs="CERT_NONE",
+    headers=HEADERS,
+    retries=urllib3.Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+)
+
+HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+
+ARTICLE_FILE_HREF_RE = re.compile(
+    r"(?:https?://[^\s\"'>]+/)?(?:artigo-|post-|blog/|posts/)(?P<slug>[^\"'>\s/]+)\.html",
+    re.IGNORECASE,
+)
+POST_URL_HREF_RE = re.compile(
+    r"(?:https?://(?:www\.)?fcgestaoestrategica\.com\.br)?/(?P<slug>[^/?#]+)/?",
+    re.IGNORECASE,
+)
+
+DATE_NUMERIC_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})")
+DATE_PTBR_RE = re.compile(r"(\d{1,2})\s+de\s+([a-zç]+)\s+de\s+(\d{4})")
+SAFE_FILENAME_RE = re.compile(r"[<>:\"/\\|?*]")
+DASH_RUN_RE = re.compile(r"-+")
+
+IMG_KEEP_ATTRS = frozenset({"alt", "title", "class", "width", "height", "id", "style"})
+
+LINK_PROBES = ("artigo-", "post-", "blog/", "posts/")
+
+ARTICLE_PREFIXES = ("artigo-", "post-")
+ARTICLE_DIRS = frozenset({"blog", "posts"})
+TEXT_SUFFIXES = (".html", ".md", ".json", ".xml")
+
+
+@functools.lru_cache(maxsize=512)
+def esc(value: str) -> str:
+    return html.escape(value)
+
+
+def parse_fragment(html_text: str) -> BeautifulSoup:
+    """Parse an HTML fragment; lxml wraps fragments in html/head/body, so unwrap those."""
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+    if HTML_PARSER != "html.parser":
+        for wrapper_name in ("head", "body", "html"):
+            wrapper = getattr(soup, wrapper_name)
+            if wrapper is not None:
+                wrapper.unwrap()
+    return soup
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Publish data under path via tmp file + os.replace so readers never see torn writes."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
-def http_get(url: str, headers: dict[str, str] | None = None, timeout: int = 30) -> tuple[bytes, str | None, str]:
-    request = Request(url, headers=headers or {})
-    with urlopen(request, timeout=timeout, context=SSL_CONTEXT) as response:
-        data = response.read()
-        content_type = response.headers.get("Content-Type")
-        encoding = response.headers.get_content_charset() or "utf-8"
-    return data, content_type, encoding
+def dump_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
 
 
-def fetch(url: str, retries: int = 3) -> str:
-    backoff = 1
-    for attempt in range(retries):
-        try:
-            data, _, encoding = http_get(url, headers=HEADERS, timeout=30)
-            return data.decode(encoding, errors="replace")
-        except Exception:
-            if attempt == retries - 1:
-                raise
-            time.sleep(backoff)
-            backoff *= 2
-    raise RuntimeError(f"Failed to fetch {url}")
+def dump_json_compact(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
 
+def charset_from_content_type(content_type: str | None) -> str:
+    if content_type and "charset=" in content_type:
+        return content_type.split("charset=", 1)[1].split(";", 1)[0].strip() or "utf-8"
+    return "utf-8"
 
+
+def http_get(url: str, timeout: int = 30) -> tuple[bytes, str | None, str]:
+    response = POOL.request("GET", url, timeout=timeout)
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status} for {url}")
+    content_type = response.headers.get("Content-Type")
+    return response.data, content_type, charset_from_content_type(content_type)
+
+
+FORCE_FETCH = False
+
+
+def fetch(url: str, ttl: int = POST_CACHE_TTL) -> str:
+    """GET url, serving from the on-disk HTML cache while the entry is fresh."""
+    cache_path = HTML_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.html"
+    if not FORCE_FETCH:
+        try:
+            if time.time() - cache_path.stat().st_mtime < ttl:
+                return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+    data, _, encoding = http_get(url)
+    text = data.decode(encoding, errors="replace")
+    HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(cache_path, text.encode("utf-8"))
+    return text
+
+
+@functools.lru_cache(maxsize=4096)
 def slug_from_url(url: str) -> str:
     parsed = urlparse(url)
     if parsed.netloc and "fcgestaoestrategica.com.br" not in parsed.netloc:
@@ -110,17 +254,22 @@ def slug_from_url(url: str) -> str:
     return slug
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_date_text(text: str) -> str | None:
     if not text:
         return None
     value = text.strip()
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
     try:
         iso_val = value.replace("Z", "+00:00")
         return datetime.fromisoformat(iso_val).date().isoformat()
     except Exception:
         pass
 
-    match = re.search(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})", value)
+    match = DATE_NUMERIC_RE.search(value)
     if match:
         day, month, year = match.groups()
         year_int = int(year)
@@ -132,7 +281,7 @@ def parse_date_text(text: str) -> str | None:
             return None
 
     lowered = value.lower()
-    match = re.search(r"(\d{1,2})\s+de\s+([a-zç]+)\s+de\s+(\d{4})", lowered)
+    match = DATE_PTBR_RE.search(lowered)
     if match:
         day, month_name, year = match.groups()
         month = MONTHS_PT.get(month_name)
@@ -146,55 +295,52 @@ def parse_date_text(text: str) -> str | None:
 
 def date_human_ptbr(date_iso: str) -> str:
     try:
-        date_obj = datetime.fromisoformat(date_iso).date()
+        date_obj = date.fromisoformat(date_iso)
     except Exception:
         return date_iso
-    months = [
-        "janeiro",
-        "fevereiro",
-        "março",
-        "abril",
-        "maio",
-        "junho",
-        "julho",
-        "agosto",
-        "setembro",
-        "outubro",
-        "novembro",
-        "dezembro",
-    ]
-    return f"{date_obj.day} de {months[date_obj.month - 1]} de {date_obj.year}"
+    return f"{date_obj.day} de {MONTHS_PT_LIST[date_obj.month - 1]} de {date_obj.year}"
+
 
+def candidate_url(href: str) -> str:
+    if href.startswith("/") or href.startswith(BASE_URL):
+        return href
+    return urljoin(BASE_URL, href)
 
-def discover_post_urls() -> tuple[list[str], dict[str, str]]:
-    urls: list[str] = []
+
+def safe_fetch_index(url: str) -> str | None:
+    try:
+        return fetch(url, ttl=INDEX_CACHE_TTL)
+    except Exception:
+        return None
+
+
+def discover_post_urls() -> tuple[list[tuple[str, str]], dict[str, str]]:
+    """Return ((url, slug) pairs, index dates); slugs come from the discovery pass itself."""
+    pairs: list[tuple[str, str]] = []
     seen: set[str] = set()
+    page_urls = [BLOG_INDEX] + [f"{BLOG_INDEX}{page_num}/" for page_num in range(2, 10)]
+    with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+        page_bodies = list(executor.map(safe_fetch_index, page_urls))
+
     empty_streak = 0
-    for page_num in range(1, 10):
-        url = BLOG_INDEX if page_num == 1 else f"{BLOG_INDEX}{page_num}/"
-        try:
-            html_text = fetch(url)
-        except Exception:
+    for html_text in page_bodies:
+        if html_text is None:
             break
 
-        page_urls: list[str] = []
-        for href in re.findall(r'href=["\\\']([^"\\\']+)["\\\']', html_text, flags=re.IGNORECASE):
-            abs_url = urljoin(BASE_URL, href)
-            slug = slug_from_url(abs_url)
-            if not slug or slug in seen:
-                continue
-            seen.add(slug)
-            page_urls.append(f"{BASE_URL}/{slug}/")
+        page_slugs = {slug_from_url(candidate_url(href)) for href in HREF_RE.findall(html_text)}
+        page_slugs.discard("")
+        page_slugs -= seen
 
-        if not page_urls:
+        if not page_slugs:
             empty_streak += 1
             if empty_streak >= 2:
                 break
         else:
             empty_streak = 0
-            urls.extend(page_urls)
+            seen |= page_slugs
+            pairs.extend((f"{BASE_URL}/{slug}/", slug) for slug in sorted(page_slugs))
 
-    return urls, {}
+    return pairs, {}
 
 
 def pick_image_url(img_tag) -> str | None:
@@ -219,11 +365,12 @@ def pick_image_url(img_tag) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def safe_filename(name: str) -> str:
     name = name.strip()
-    name = re.sub(r"[<>:\"/\\|?*]", "-", name)
+    name = SAFE_FILENAME_RE.sub("-", name)
     name = name.replace(" ", "-")
-    name = re.sub(r"-+", "-", name)
+    name = DASH_RUN_RE.sub("-", name)
     return name or "imagem"
 
 
@@ -250,10 +397,35 @@ def copy_local_asset(src_path: Path, slug: str, report: dict[str, Any]) -> str |
     dest_path = dest_dir / filename
     if not dest_path.exists():
         shutil.copy2(src_path, dest_path)
-        report["totalImagesDownloaded"] += 1
+        with REPORT_LOCK:
+            report["totalImagesDownloaded"] += 1
     return dest_path.relative_to(ROOT_DIR).as_posix()
 
 
+def asset_meta_path(url: str) -> Path:
+    return ASSET_META_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def load_asset_meta(url: str) -> dict[str, str]:
+    try:
+        return json.loads(asset_meta_path(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_asset_meta(url: str, headers: Any) -> None:
+    meta = {}
+    etag = headers.get("ETag")
+    if etag:
+        meta["etag"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        meta["last-modified"] = last_modified
+    if meta:
+        ASSET_META_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(asset_meta_path(url), dump_json_bytes(meta))
+
+
 def download_asset(url: str, slug: str, report: dict[str, Any]) -> str | None:
     if not url:
         return None
@@ -262,15 +434,43 @@ def download_asset(url: str, slug: str, report: dict[str, Any]) -> str | None:
     dest_dir = ASSETS_DIR / slug
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest_path = dest_dir / filename
-    if dest_path.exists() and dest_path.stat().st_size > 0:
+    cached = dest_path.exists() and dest_path.stat().st_size > 0
+    if cached and not FORCE_FETCH:
         return dest_path.relative_to(ROOT_DIR).as_posix()
 
+    request_headers = dict(HEADERS)
+    if cached:
+        meta = load_asset_meta(url)
+        if "etag" in meta:
+            request_headers["If-None-Match"] = meta["etag"]
+        if "last-modified" in meta:
+            request_headers["If-Modified-Since"] = meta["last-modified"]
+
     try:
-        data, content_type, _ = http_get(url, headers=HEADERS, timeout=30)
-        filename = ensure_extension(dest_path.name, content_type)
-        dest_path = dest_dir / filename
-        dest_path.write_bytes(data)
-        report["totalImagesDownloaded"] += 1
+        response = POOL.request("GET", url, timeout=30, headers=request_headers, preload_content=False)
+        try:
+            if response.status == 304:
+                return dest_path.relative_to(ROOT_DIR).as_posix()
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP {response.status} for {url}")
+            filename = ensure_extension(dest_path.name, response.headers.get("Content-Type"))
+            dest_path = dest_dir / filename
+            tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+            try:
+                with open(tmp_path, "wb") as handle:
+                    for chunk in response.stream(65536):
+                        handle.write(chunk)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            os.replace(tmp_path, dest_path)
+        finally:
+            response.release_conn()
+        save_asset_meta(url, response.headers)
+        with REPORT_LOCK:
+            report["totalImagesDownloaded"] += 1
         return dest_path.relative_to(ROOT_DIR).as_posix()
     except Exception:
         return None
@@ -304,21 +504,25 @@ def extract_body_html(html_text: str) -> str:
     if not html_text:
         return ""
 
-    widgets = re.findall(
-        r'<div[^>]+class=["\'][^"\']*elementor-widget-container[^"\']*["\'][^>]*>(.*?)</div>',
-        html_text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+    widgets = soup.select("div.elementor-widget-container")
     if widgets:
-        return "\n".join(widgets)
+        # find_all yields document order, so parents always precede children:
+        # marking each widget's nested widgets as excluded keeps only the
+        # outermost containers without walking ancestors per element.
+        excluded: set[int] = set()
+        parts: list[str] = []
+        for widget in widgets:
+            if id(widget) in excluded:
+                continue
+            parts.append(widget.decode_contents())
+            for sub in widget.select("div.elementor-widget-container"):
+                excluded.add(id(sub))
+        return "\n".join(parts)
 
-    for pattern in [
-        r"<article[^>]*>(.*?)</article>",
-        r'<div[^>]+class=["\'][^"\']*entry-content[^"\']*["\'][^>]*>(.*?)</div>',
-    ]:
-        match = re.search(pattern, html_text, flags=re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1)
+    node = soup.find("article") or soup.find("div", class_="entry-content")
+    if node is not None:
+        return node.decode_contents()
 
     return ""
 
@@ -327,56 +531,59 @@ def strip_tags(text: str) -> str:
     return re.sub(r"<[^>]+>", " ", text or "").strip()
 
 
-def find_first_img_url(html_text: str) -> str | None:
-    match = re.search(r"<img[^>]+(?:data-src|data-lazy-src|nitro-lazy-src|data-original|src)=[\"']([^\"']+)[\"']", html_text, flags=re.IGNORECASE)
-    return match.group(1) if match else None
-
-
-def rewrite_images_in_html(html_text: str, slug: str, report: dict[str, Any]) -> str:
-    def replace_img(match: re.Match) -> str:
-        tag = match.group(0)
-        attrs = dict(re.findall(r'([\w:-]+)\s*=\s*["\']([^"\']*)["\']', tag))
-        src = (
-            attrs.get("data-src")
-            or attrs.get("data-lazy-src")
-            or attrs.get("nitro-lazy-src")
-            or attrs.get("data-original")
-            or attrs.get("src")
-        )
-        if not src or src.startswith("data:"):
-            return tag
-        marker = "blog.html#post-"
-        if marker in src:
-            tail = src.split(marker, 1)[1]
-            if tail.startswith(slug):
-                filename = tail[len(slug):].lstrip("/").lstrip("-")
-                src = f"imagens/blog/{slug}/{filename}"
-        local_path = localize_image(src, slug, report)
-        if not local_path:
-            return tag
-        kept_keys = ["alt", "title", "class", "width", "height", "id", "style"]
-        kept_attrs = []
-        for key in kept_keys:
-            if key in attrs:
-                kept_attrs.append(f'{key}="{html.escape(attrs[key], quote=True)}"')
-        extra = f" {' '.join(kept_attrs)}" if kept_attrs else ""
-        return f'<img src="{local_path}" loading="lazy" decoding="async"{extra}>'
-
-    return re.sub(r"<img\b[^>]*>", replace_img, html_text, flags=re.IGNORECASE)
-
-
-def replace_post_href_links(html_text: str, slug_map: dict[str, str]) -> tuple[str, int]:
-    total = 0
-    updated = html_text
-    for slug, target in slug_map.items():
-        patterns = [
-            rf'href=["\']https?://(?:www\\.)?fcgestaoestrategica\\.com\\.br/{re.escape(slug)}/?["\']',
-            rf'href=["\']/{re.escape(slug)}/?["\']',
-        ]
-        for pattern in patterns:
-            updated, count = re.subn(pattern, f'href="{target}"', updated, flags=re.IGNORECASE)
-            total += count
-    return updated, total
+def resolve_img_src(img: Tag, slug: str) -> str | None:
+    src = pick_image_url(img)
+    if not src:
+        return None
+    marker = "blog.html#post-"
+    if marker in src:
+        tail = src.split(marker, 1)[1]
+        if tail.startswith(slug):
+            filename = tail[len(slug):].lstrip("/").lstrip("-")
+            src = f"imagens/blog/{slug}/{filename}"
+    return src
+
+
+def apply_img_attrs(img: Tag, local_path: str) -> None:
+    attrs = img.attrs
+    kept = {key: attrs[key] for key in IMG_KEEP_ATTRS.intersection(attrs)}
+    img.attrs = {"src": local_path, "loading": "lazy", "decoding": "async", **kept}
+
+
+def localize_images(soup: BeautifulSoup, slug: str, report: dict[str, Any]) -> None:
+    """Resolve every img src first, then download the unique ones in parallel."""
+    planned: list[tuple[Tag, str]] = []
+    for img in soup.select("img"):
+        src = resolve_img_src(img, slug)
+        if src:
+            planned.append((img, src))
+    if not planned:
+        return
+    unique = list(dict.fromkeys(src for _, src in planned))
+    local_paths = IMAGE_EXECUTOR.map(lambda src: localize_image(src, slug, report), unique)
+    local_map = dict(zip(unique, local_paths))
+    for img, src in planned:
+        local_path = local_map.get(src)
+        if local_path:
+            apply_img_attrs(img, local_path)
+
+
+def fix_anchor_href(a_tag: Tag, slug_map: dict[str, str]) -> int:
+    href = (a_tag.get("href") or "").strip()
+    if not href:
+        return 0
+    match = ARTICLE_FILE_HREF_RE.fullmatch(href)
+    if match:
+        slug = match.group("slug")
+        a_tag["href"] = slug_map.get(slug, f"blog.html#post-{slug}")
+        return 1
+    match = POST_URL_HREF_RE.fullmatch(href)
+    if match:
+        target = slug_map.get(match.group("slug"))
+        if target:
+            a_tag["href"] = target
+            return 1
+    return 0
 
 
 def clean_content_html(
@@ -384,38 +591,50 @@ def clean_content_html(
     slug: str,
     slug_map: dict[str, str],
     report: dict[str, Any],
-) -> str:
-    cleaned = re.sub(r"<(script|style|noscript)[^>]*>.*?</\\1>", "", html_text, flags=re.IGNORECASE | re.DOTALL)
-    cleaned, count = replace_article_links_in_text(cleaned, slug_map)
-    report["brokenInternalRefsFixedCount"] += count
-    cleaned, count = replace_post_href_links(cleaned, slug_map)
-    report["brokenInternalRefsFixedCount"] += count
-    cleaned = rewrite_images_in_html(cleaned, slug, report)
-    cleaned = re.sub(r"<h1(\b[^>]*)>", r"<h2\\1>", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"</h1>", "</h2>", cleaned, flags=re.IGNORECASE)
-    return cleaned
+) -> BeautifulSoup:
+    soup = parse_fragment(html_text)
+    for node in soup.find_all(["script", "style", "noscript"]):
+        node.decompose()
+    fixed = 0
+    for a_tag in soup.select("a[href]"):
+        fixed += fix_anchor_href(a_tag, slug_map)
+    with REPORT_LOCK:
+        report["brokenInternalRefsFixedCount"] += fixed
+    localize_images(soup, slug, report)
+    for h1 in soup.find_all("h1"):
+        h1.name = "h2"
+    return soup
 
 
 def make_excerpt(text: str, max_len: int = 220) -> str:
-    compact = re.sub(r"\s+", " ", text or "").strip()
+    compact = " ".join((text or "").split())
     if len(compact) <= max_len:
         return compact
     return compact[: max_len - 3].rstrip() + "..."
 
 
+@functools.lru_cache(maxsize=None)
+def tag_text_pattern(tag: str) -> re.Pattern[str]:
+    return re.compile(rf"<{tag}[^>]*>(.*?)</{tag}>", re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def meta_content_pattern(attr: str, key: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"<meta[^>]+{attr}=[\"']{re.escape(key)}[\"'][^>]*content=[\"']([^\"']+)[\"']",
+        re.IGNORECASE,
+    )
+
+
 def extract_tag_text(html_text: str, tag: str) -> str:
-    match = re.search(rf"<{tag}[^>]*>(.*?)</{tag}>", html_text, flags=re.IGNORECASE | re.DOTALL)
+    match = tag_text_pattern(tag).search(html_text)
     if not match:
         return ""
     return strip_tags(match.group(1))
 
 
 def extract_meta_content(html_text: str, attr: str, key: str) -> str:
-    pattern = re.compile(
-        rf"<meta[^>]+{attr}=[\"']{re.escape(key)}[\"'][^>]*content=[\"']([^\"']+)[\"']",
-        flags=re.IGNORECASE,
-    )
-    match = pattern.search(html_text)
+    match = meta_content_pattern(attr, key).search(html_text)
     return match.group(1).strip() if match else ""
 
 
@@ -429,7 +648,8 @@ def extract_post_data(
     try:
         html_text = fetch(url)
     except Exception as exc:
-        report["falhas"].append({"url": url, "motivo": f"fetch failed: {exc}"})
+        with REPORT_LOCK:
+            report["falhas"].append({"url": url, "motivo": f"fetch failed: {exc}"})
         return None
 
     title = extract_tag_text(html_text, "h1") or extract_meta_content(html_text, "property", "og:title") or slug
@@ -439,7 +659,7 @@ def extract_post_data(
     if not date_iso:
         date_iso = index_dates.get(slug)
     if not date_iso:
-        date_iso = datetime.utcnow().date().isoformat()
+        date_iso = TODAY_ISO
 
     date_human = date_human_ptbr(date_iso)
 
@@ -448,21 +668,22 @@ def extract_post_data(
 
     body_html = extract_body_html(html_text)
     if not body_html:
-        report["falhas"].append({"url": url, "motivo": "conteudo vazio"})
+        with REPORT_LOCK:
+            report["falhas"].append({"url": url, "motivo": "conteudo vazio"})
         return None
 
-    clean_html = clean_content_html(body_html, slug, slug_map, report)
+    body_soup = clean_content_html(body_html, slug, slug_map, report)
+    clean_html = body_soup.decode_contents()
 
-    body_text = strip_tags(clean_html)
     excerpt = extract_meta_content(html_text, "name", "description")
     if not excerpt:
-        excerpt = make_excerpt(body_text)
+        excerpt = make_excerpt(body_soup.get_text(" ", strip=True))
 
     cover_path = None
     if cover_url:
         cover_path = localize_image(cover_url, slug, report)
     if not cover_path:
-        first_img = find_first_img_url(clean_html)
+        first_img = pick_image_url(body_soup.find("img"))
         if first_img:
             cover_path = localize_image(first_img, slug, report) or first_img
 
@@ -490,17 +711,15 @@ def load_or_sync_posts(refresh: bool, slug_map: dict[str, str]) -> tuple[list[di
         posts = json.loads(POSTS_JSON_PATH.read_text(encoding="utf-8"))
         return posts, report
 
-    post_urls, index_dates = discover_post_urls()
-    posts: list[dict[str, Any]] = []
-    for url in post_urls:
-        slug = slug_from_url(url)
-        if not slug:
-            continue
-        post = extract_post_data(url, slug, index_dates, slug_map, report)
-        if post:
-            posts.append(post)
+    pairs, index_dates = discover_post_urls()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        results = executor.map(
+            lambda pair: extract_post_data(pair[0], pair[1], index_dates, slug_map, report),
+            pairs,
+        )
+        posts = [post for post in results if post]
 
-    posts.sort(key=lambda item: item.get("dateISO", ""), reverse=True)
+    posts.sort(key=itemgetter("dateISO"), reverse=True)
     return posts, report
 
 
@@ -514,8 +733,10 @@ def process_existing_posts(
         slug = post.get("slug", "")
         if not slug:
             continue
+        post.setdefault("dateISO", "")
         content_html = post.get("contentHtml", "")
-        cleaned_html = clean_content_html(content_html, slug, slug_map, report)
+        body_soup = clean_content_html(content_html, slug, slug_map, report)
+        cleaned_html = body_soup.decode_contents()
         post["contentHtml"] = cleaned_html
 
         cover_path = post.get("coverImagePath", "")
@@ -527,25 +748,25 @@ def process_existing_posts(
                     cover_path = f"imagens/blog/{slug}/{filename}"
             post["coverImagePath"] = localize_image(cover_path, slug, report) or cover_path
         else:
-            first_img = find_first_img_url(cleaned_html)
+            first_img = pick_image_url(body_soup.find("img"))
             if first_img:
                 post["coverImagePath"] = first_img
 
         if not post.get("excerpt"):
-            post["excerpt"] = make_excerpt(strip_tags(cleaned_html))
+            post["excerpt"] = make_excerpt(body_soup.get_text(" ", strip=True))
 
         if post.get("dateISO") and not post.get("dateHumanPTBR"):
             post["dateHumanPTBR"] = date_human_ptbr(post["dateISO"])
 
         processed.append(post)
 
-    processed.sort(key=lambda item: item.get("dateISO", ""), reverse=True)
+    processed.sort(key=itemgetter("dateISO"), reverse=True)
     return processed
 
 def render_search_controls(categories: list[str]) -> str:
     options = ['<option value="all">Todas as categorias</option>']
     for category in categories:
-        options.append(f'<option value="{html.escape(category.lower())}">{html.escape(category)}</option>')
+        options.append(f'<option value="{esc(category.lower())}">{esc(category)}</option>')
     return f"""
 <div id="blog-filters" class="mb-10 flex flex-col md:flex-row gap-4 items-start md:items-end">
   <div class="w-full md:flex-1">
@@ -565,29 +786,34 @@ def render_search_controls(categories: list[str]) -> str:
 def render_cards(posts: list[dict[str, Any]]) -> str:
     cards: list[str] = []
     for idx, post in enumerate(posts):
-        delay = idx * 100
+        title = post.get("title", "")
+        excerpt = post.get("excerpt", "")
         category = post.get("category") or "Blog"
-        data_search = f"{post.get('title','')} {post.get('excerpt','')} {category}".strip().lower()
-        image_html = ""
-        if post.get("coverImagePath"):
+        title_esc = esc(title)
+        excerpt_esc = esc(excerpt)
+        category_esc = esc(category)
+        cover_path = post.get("coverImagePath")
+        if cover_path:
             image_html = (
-                f'<img src="{html.escape(post["coverImagePath"])}" alt="{html.escape(post["title"])}" '
+                f'<img src="{esc(cover_path)}" alt="{title_esc}" '
                 'class="w-full h-48 object-cover" decoding="async" loading="lazy"/>'
             )
         else:
             image_html = '<div class="w-full h-48 bg-gradient-to-r from-slate-200 via-slate-100 to-slate-200"></div>'
 
+        data_search = esc(f"{title} {excerpt} {category}".strip().lower())
         cards.append(
-            f"""
-<a href="#post-{html.escape(post['slug'])}" class="post-card block bg-white rounded-lg shadow-md overflow-hidden transition hover:shadow-xl animated-item fade-in" style="transition-delay: {delay}ms;" data-post-card data-category="{html.escape(category.lower())}" data-search="{html.escape(data_search)}">
-  {image_html}
-  <div class="p-6">
-    <p class="text-sm text-slate-500">{html.escape(category)} • {html.escape(post.get("dateHumanPTBR",""))}</p>
-    <h3 class="mt-2 text-xl font-bold text-slate-900">{html.escape(post["title"])}</h3>
-    <p class="mt-2 text-slate-600">{html.escape(post.get("excerpt",""))}</p>
-  </div>
-</a>
-""".strip()
+            "".join(
+                (
+                    f'<a href="#post-{esc(post["slug"])}" class="post-card block bg-white rounded-lg shadow-md overflow-hidden transition hover:shadow-xl animated-item fade-in" style="transition-delay: {idx * 100}ms;" data-post-card data-category="{esc(category.lower())}" data-search="{data_search}">\n  ',
+                    image_html,
+                    '\n  <div class="p-6">\n'
+                    f'    <p class="text-sm text-slate-500">{category_esc} • {esc(post.get("dateHumanPTBR", ""))}</p>\n'
+                    f'    <h3 class="mt-2 text-xl font-bold text-slate-900">{title_esc}</h3>\n'
+                    f'    <p class="mt-2 text-slate-600">{excerpt_esc}</p>\n'
+                    "  </div>\n</a>",
+                )
+            )
         )
     return "\n".join(cards)
 
@@ -610,7 +836,7 @@ def render_post_jsonld(post: dict[str, Any], site_url: str) -> str:
     }
     if post.get("coverImagePath"):
         data["image"] = [f"{site_url}/{post['coverImagePath'].lstrip('/')}"]
-    return json.dumps(data, ensure_ascii=False)
+    return dump_json_compact(data)
 
 
 def render_gallery_section(posts: list[dict[str, Any]]) -> str:
@@ -632,34 +858,38 @@ def render_gallery_section(posts: list[dict[str, Any]]) -> str:
 def render_reader_section(posts: list[dict[str, Any]], site_url: str) -> str:
     articles: list[str] = []
     for post in posts:
+        title_esc = esc(post["title"])
+        cover_path = post.get("coverImagePath")
         cover_html = ""
-        if post.get("coverImagePath"):
+        if cover_path:
             cover_html = (
-                f'<img src="{html.escape(post["coverImagePath"])}" alt="{html.escape(post["title"])}" '
+                f'<img src="{esc(cover_path)}" alt="{title_esc}" '
                 'class="w-full h-auto rounded-xl shadow-lg my-8" decoding="async" loading="lazy"/>'
             )
 
         articles.append(
-            f"""
-<article id="post-{html.escape(post['slug'])}" data-post-article class="post-article bg-white rounded-2xl shadow-lg p-8 md:p-10 animated-item fade-in is-hidden">
-  <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-4">
-    <div>
-      <p class="text-sm text-slate-500">{html.escape(post.get("category","Blog"))} • {html.escape(post.get("dateHumanPTBR",""))}</p>
-      <h2 class="text-2xl md:text-3xl font-bold text-slate-900 mt-2" tabindex="-1">{html.escape(post["title"])}</h2>
-      <p class="text-slate-600 mt-3">{html.escape(post.get("excerpt",""))}</p>
-    </div>
-    <a href="#blog" class="inline-flex items-center justify-center text-white font-bold py-3 px-6 rounded-lg cta-button cta-button-standard">Voltar ao Blog</a>
-  </div>
-  {cover_html}
-  <div class="prose max-w-none text-slate-600">
-    {post.get("contentHtml", "")}
-  </div>
-  <div class="mt-8">
-    <a href="#blog" class="text-sm font-semibold text-[--brand-blue] hover:underline">Voltar ao Blog</a>
-  </div>
-  <script type="application/ld+json">{render_post_jsonld(post, site_url)}</script>
-</article>
-""".strip()
+            "".join(
+                (
+                    f'<article id="post-{esc(post["slug"])}" data-post-article class="post-article bg-white rounded-2xl shadow-lg p-8 md:p-10 animated-item fade-in is-hidden">\n'
+                    '  <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-4">\n'
+                    "    <div>\n"
+                    f'      <p class="text-sm text-slate-500">{esc(post.get("category", "Blog"))} • {esc(post.get("dateHumanPTBR", ""))}</p>\n'
+                    f'      <h2 class="text-2xl md:text-3xl font-bold text-slate-900 mt-2" tabindex="-1">{title_esc}</h2>\n'
+                    f'      <p class="text-slate-600 mt-3">{esc(post.get("excerpt", ""))}</p>\n'
+                    "    </div>\n"
+                    '    <a href="#blog" class="inline-flex items-center justify-center text-white font-bold py-3 px-6 rounded-lg cta-button cta-button-standard">Voltar ao Blog</a>\n'
+                    "  </div>\n  ",
+                    cover_html,
+                    '\n  <div class="prose max-w-none text-slate-600">\n    ',
+                    post.get("contentHtml", ""),
+                    '\n  </div>\n'
+                    '  <div class="mt-8">\n'
+                    '    <a href="#blog" class="text-sm font-semibold text-[--brand-blue] hover:underline">Voltar ao Blog</a>\n'
+                    "  </div>\n"
+                    f'  <script type="application/ld+json">{render_post_jsonld(post, site_url)}</script>\n'
+                    "</article>",
+                )
+            )
         )
 
     return f"""
@@ -673,15 +903,14 @@ def render_reader_section(posts: list[dict[str, Any]], site_url: str) -> str:
 """.strip()
 
 
-def get_site_url() -> str:
-    if not BLOG_HTML_PATH.exists():
-        return "https://fcgestaoestrategica.com.br"
-    html_text = BLOG_HTML_PATH.read_text(encoding="utf-8", errors="ignore")
-    match = re.search(
-        r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
-        html_text,
-        flags=re.IGNORECASE,
-    )
+CANONICAL_HREF_RE = re.compile(
+    r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+
+def get_site_url(html_text: str) -> str:
+    match = CANONICAL_HREF_RE.search(html_text)
     if match:
         href = match.group(1).rstrip("/")
         if href.endswith("/blog.html"):
@@ -689,101 +918,7 @@ def get_site_url() -> str:
     return "https://fcgestaoestrategica.com.br"
 
 
-def ensure_hidden_style(html_text: str) -> str:
-    if ".is-hidden" in html_text:
-        return html_text
-    if re.search(r"</style>", html_text, flags=re.IGNORECASE):
-        return re.sub(
-            r"</style>",
-            "\n        .is-hidden { display: none !important; }\n</style>",
-            html_text,
-            count=1,
-            flags=re.IGNORECASE,
-        )
-    return re.sub(
-        r"</head>",
-        "<style>\n        .is-hidden { display: none !important; }\n    </style>\n</head>",
-        html_text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
-
-
-def replace_section(html_text: str, section_id: str, new_html: str) -> tuple[str, bool]:
-    pattern = re.compile(
-        rf"<section[^>]*\bid=[\"']{re.escape(section_id)}[\"'][^>]*>.*?</section>",
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    if pattern.search(html_text):
-        return pattern.sub(new_html, html_text, count=1), True
-    return html_text, False
-
-
-def update_blog_html(posts: list[dict[str, Any]]) -> None:
-    html_text = BLOG_HTML_PATH.read_text(encoding="utf-8", errors="ignore")
-    html_text = ensure_hidden_style(html_text)
-
-    html_text = re.sub(
-        r"<script[^>]*id=[\"']blog-(interactions|spa)[\"'][^>]*>.*?</script>",
-        "",
-        html_text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    html_text = re.sub(
-        r"<script[^>]*id=[\"']posts-data[\"'][^>]*>.*?</script>",
-        "",
-        html_text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    html_text = re.sub(
-        r"<section[^>]*id=[\"']blog-back-to-top[\"'][^>]*>.*?</section>",
-        "",
-        html_text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    html_text = re.sub(
-        r"<section[^>]*>.*?id=[\"']blog-back-to-top[\"'].*?</section>",
-        "",
-        html_text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-
-    site_url = get_site_url()
-    gallery_html = render_gallery_section(posts)
-    reader_html = render_reader_section(posts, site_url)
-
-    html_text, gallery_replaced = replace_section(html_text, "blog-gallery", gallery_html)
-    if not gallery_replaced:
-        html_text, gallery_replaced = replace_section(html_text, "blog-list", gallery_html)
-
-    html_text, reader_replaced = replace_section(html_text, "blog-reader", reader_html)
-    if not reader_replaced:
-        html_text, reader_replaced = replace_section(html_text, "blog-details", reader_html)
-
-    if not gallery_replaced:
-        hero_match = re.search(
-            r"(<section\b[^>]*class=[\"'][^\"']*page-header[^\"']*[\"'][^>]*>.*?</section>)",
-            html_text,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
-        if hero_match:
-            hero_block = hero_match.group(1)
-            html_text = html_text.replace(
-                hero_block,
-                f"{hero_block}\n{gallery_html}\n{reader_html}",
-                1,
-            )
-
-    if "id=\"blog-gallery\"" not in html_text or "id=\"blog-reader\"" not in html_text:
-        main_match = re.search(r"(<main[^>]*>)(.*?)(</main>)", html_text, flags=re.IGNORECASE | re.DOTALL)
-        if main_match:
-            html_text = html_text.replace(
-                main_match.group(0),
-                f"{main_match.group(1)}\n{gallery_html}\n{reader_html}\n{main_match.group(3)}",
-                1,
-            )
-
-    script_text = """
+SPA_JS = """
 document.addEventListener("DOMContentLoaded", () => {
   const animationObserver = new IntersectionObserver(entries => {
     entries.forEach((entry) => {
@@ -898,53 +1033,157 @@ document.addEventListener("DOMContentLoaded", () => {
   window.addEventListener('hashchange', handleHash);
 });
 """.strip()
-    if "</body>" in html_text:
-        html_text = html_text.replace("</body>", f"<script id=\"blog-spa\">{script_text}</script></body>", 1)
-    else:
-        html_text += f"\n<script id=\"blog-spa\">{script_text}</script>\n"
 
-    BLOG_HTML_PATH.write_text(html_text, encoding="utf-8")
+
+def ensure_hidden_style(soup: BeautifulSoup) -> None:
+    rule = "\n        .is-hidden { display: none !important; }\n"
+    styles = soup.find_all("style")
+    for style in styles:
+        if ".is-hidden" in style.get_text():
+            return
+    if styles:
+        styles[0].append(rule)
+        return
+    new_style = soup.new_tag("style")
+    new_style.string = rule
+    if soup.head is not None:
+        soup.head.append(new_style)
+
+
+GALLERY_MARKER = "blog-gallery-fragment"
+READER_MARKER = "blog-reader-fragment"
+
+
+def replace_section(soup: BeautifulSoup, section_id: str, marker: str) -> bool:
+    """Swap the section for a comment marker; the real HTML is spliced in as text later."""
+    node = soup.select_one(f"section#{section_id}")
+    if node is None:
+        return False
+    node.replace_with(Comment(marker))
+    return True
+
+
+def update_blog_html(posts: list[dict[str, Any]]) -> None:
+    html_text = BLOG_HTML_PATH.read_text(encoding="utf-8", errors="ignore")
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+    ensure_hidden_style(soup)
+
+    for node in soup.select(
+        "script#blog-interactions, script#blog-spa, script#posts-data, "
+        "section#blog-back-to-top, section:has(#blog-back-to-top)"
+    ):
+        node.decompose()
+
+    site_url = get_site_url(html_text)
+    gallery_html = render_gallery_section(posts)
+    reader_html = render_reader_section(posts, site_url)
+
+    gallery_replaced = replace_section(soup, "blog-gallery", GALLERY_MARKER)
+    if not gallery_replaced:
+        gallery_replaced = replace_section(soup, "blog-list", GALLERY_MARKER)
+
+    reader_replaced = replace_section(soup, "blog-reader", READER_MARKER)
+    if not reader_replaced:
+        reader_replaced = replace_section(soup, "blog-details", READER_MARKER)
+
+    hero_inserted = False
+    if not gallery_replaced:
+        hero = soup.select_one("section[class*=page-header]")
+        if hero is not None:
+            hero.insert_after(Comment(READER_MARKER))
+            hero.insert_after(Comment(GALLERY_MARKER))
+            hero_inserted = True
+
+    if not (gallery_replaced or hero_inserted) or not (reader_replaced or hero_inserted):
+        main_node = soup.find("main")
+        if main_node is not None:
+            main_node.append(Comment(GALLERY_MARKER))
+            main_node.append(Comment(READER_MARKER))
+
+    if not SPA_JS_PATH.exists() or SPA_JS_PATH.read_text(encoding="utf-8") != SPA_JS:
+        SPA_JS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        SPA_JS_PATH.write_text(SPA_JS, encoding="utf-8")
+    script_tag = soup.new_tag("script", id="blog-spa", src="assets/blog-spa.js")
+    script_tag["defer"] = ""
+    (soup.body or soup).append(script_tag)
+
+    html_bytes = soup.encode("utf-8")
+    html_bytes = html_bytes.replace(f"<!--{GALLERY_MARKER}-->".encode(), gallery_html.encode("utf-8"))
+    html_bytes = html_bytes.replace(f"<!--{READER_MARKER}-->".encode(), reader_html.encode("utf-8"))
+    atomic_write_bytes(BLOG_HTML_PATH, html_bytes)
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
 
 def update_sitemap() -> None:
     if not SITEMAP_PATH.exists():
         return
     tree = ET.parse(SITEMAP_PATH)
     root = tree.getroot()
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    loc_tag = f"{{{SITEMAP_NS}}}loc"
+    kept = []
     removed = False
-    for url in list(root.findall("sm:url", ns)):
-        loc = url.find("sm:loc", ns)
+    for url in root:
+        loc = url.find(loc_tag)
         if loc is not None and "/artigo-" in (loc.text or ""):
-            root.remove(url)
             removed = True
+            continue
+        kept.append(url)
     if removed:
-        tree.write(SITEMAP_PATH, encoding="utf-8", xml_declaration=True)
+        root[:] = kept
+        ET.register_namespace("", SITEMAP_NS)
+        buffer = BytesIO()
+        tree.write(buffer, encoding="utf-8", xml_declaration=True)
+        atomic_write_bytes(SITEMAP_PATH, buffer.getvalue())
 
 
-def collect_article_files() -> list[Path]:
-    article_files: list[Path] = []
-    for path in ROOT_DIR.rglob("*.html"):
-        if path.name == "blog.html":
-            continue
-        stem = path.stem.lower()
-        if stem.startswith("artigo-") or stem.startswith("post-"):
-            article_files.append(path)
-            continue
-        if "artigo" in stem and path.name.endswith(".html"):
-            article_files.append(path)
-            continue
-        if path.parent.name.lower() in {"blog", "posts"}:
-            article_files.append(path)
-    return sorted(set(article_files))
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "target"})
+
+
+def scandir_files(path: Path | str):
+    """Yield an os.DirEntry for every file under path, depth-first in name order.
+
+    Hidden directories (.git, .cache, .vscode, ...) and vendor/build trees are
+    pruned so the walk never descends into them.
+    """
+    with os.scandir(path) as entries:
+        for entry in sorted(entries, key=lambda item: item.name):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") or entry.name in SKIP_DIRS:
+                    continue
+                yield from scandir_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def walk_once() -> tuple[list[str], list[os.DirEntry]]:
+    """Classify every file in one scandir pass: legacy article pages vs rewritable text files."""
+    articles: list[str] = []
+    texts: list[os.DirEntry] = []
+    for entry in scandir_files(ROOT_DIR):
+        name_l = entry.name.lower()
+        if name_l.endswith(".html") and name_l != "blog.html":
+            stem = name_l[:-5]
+            if (
+                stem.startswith(ARTICLE_PREFIXES)
+                or "artigo" in stem
+                or os.path.basename(os.path.dirname(entry.path)).lower() in ARTICLE_DIRS
+            ):
+                articles.append(entry.path)
+                continue
+        if name_l.endswith(TEXT_SUFFIXES) and not name_l.startswith(ARTICLE_PREFIXES):
+            texts.append(entry)
+    return articles, texts
 
 
-def slug_from_article_path(path: Path) -> str:
-    name = path.stem
+@functools.lru_cache(maxsize=None)
+def slug_from_article_path(path_str: str) -> str:
+    name = os.path.splitext(os.path.basename(path_str))[0]
     if name.startswith("artigo-"):
         return name.replace("artigo-", "", 1)
     if name.startswith("post-"):
         return name.replace("post-", "", 1)
-    if path.parent.name.lower() in {"blog", "posts"}:
+    if os.path.basename(os.path.dirname(path_str)).lower() in {"blog", "posts"}:
         return name
     if name.startswith("artigo"):
         return name.replace("artigo", "", 1).lstrip("-_")
@@ -952,60 +1191,69 @@ def slug_from_article_path(path: Path) -> str:
 
 
 def replace_article_links_in_text(text: str, slug_map: dict[str, str]) -> tuple[str, int]:
-    total = 0
-    updated = text
-    for slug, target in slug_map.items():
-        patterns = [
-            rf"(https?://[^\s\"'>]+/)?artigo-{re.escape(slug)}\.html",
-            rf"(https?://[^\s\"'>]+/)?post-{re.escape(slug)}\.html",
-            rf"(https?://[^\s\"'>]+/)?blog/{re.escape(slug)}\.html",
-            rf"(https?://[^\s\"'>]+/)?posts/{re.escape(slug)}\.html",
-        ]
-        for pattern in patterns:
-            updated, count = re.subn(pattern, target, updated, flags=re.IGNORECASE)
-            total += count
-
-    def replace_generic(match: re.Match) -> str:
-        nonlocal total
-        total += 1
-        return f"blog.html#post-{match.group('slug')}"
-
-    generic_patterns = [
-        r"(?:https?://[^\s\"'>]+/)?(?:artigo-|post-)(?P<slug>[^\"'>\s]+)\.html",
-        r"(?:https?://[^\s\"'>]+/)?(?:blog|posts)/(?P<slug>[^\"'>\s]+)\.html",
-    ]
-    for pattern in generic_patterns:
-        updated = re.sub(pattern, replace_generic, updated, flags=re.IGNORECASE)
-    return updated, total
+    def replace(match: re.Match, _get=slug_map.get) -> str:
+        slug = match.group("slug")
+        return _get(slug) or f"blog.html#post-{slug}"
+
+    return ARTICLE_FILE_HREF_RE.subn(replace, text)
 
 
-def update_internal_references(slug_map: dict[str, str]) -> list[str]:
+def read_file_text(path_str: str, size: int) -> str:
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+_WORKER_SLUG_MAP: dict[str, str] = {}
+
+
+def init_rewrite_worker(slug_map: dict[str, str]) -> None:
+    global _WORKER_SLUG_MAP
+    _WORKER_SLUG_MAP = slug_map
+
+
+def rewrite_one(item: tuple[str, int]) -> tuple[str, int]:
+    path_str, size = item
+    try:
+        text = read_file_text(path_str, size)
+    except Exception:
+        return path_str, 0
+    if not any(probe in text for probe in LINK_PROBES):
+        return path_str, 0
+    new_text, count = replace_article_links_in_text(text, _WORKER_SLUG_MAP)
+    if count:
+        atomic_write_bytes(Path(path_str), new_text.encode("utf-8"))
+    return path_str, count
+
+
+def update_internal_references(slug_map: dict[str, str], text_files: list[os.DirEntry]) -> list[str]:
+    items = [(entry.path, entry.stat().st_size) for entry in text_files]
     updated_files: list[str] = []
-    for path in ROOT_DIR.rglob("*"):
-        if path.is_dir():
-            continue
-        if path.suffix.lower() not in {".html", ".md", ".json", ".xml"}:
-            continue
-        if path.name.startswith("artigo-") or path.name.startswith("post-"):
-            continue
-        try:
-            text = path.read_text(encoding="utf-8")
-        except Exception:
-            continue
-        new_text, count = replace_article_links_in_text(text, slug_map)
-        if count:
-            path.write_text(new_text, encoding="utf-8")
-            updated_files.append(f"{path.as_posix()} ({count})")
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=init_rewrite_worker,
+        initargs=(slug_map,),
+    ) as executor:
+        for path_str, count in executor.map(rewrite_one, items, chunksize=32):
+            if count:
+                updated_files.append(f"{path_str.replace(os.sep, '/')} ({count})")
     return updated_files
 
 
-def cleanup_articles(slug_map: dict[str, str]) -> tuple[list[str], list[str]]:
-    updated_files = update_internal_references(slug_map)
+def cleanup_articles(
+    slug_map: dict[str, str],
+    article_files: list[str],
+    text_files: list[os.DirEntry],
+) -> tuple[list[str], list[str]]:
+    updated_files = update_internal_references(slug_map, text_files)
     removed_files: list[str] = []
-    for path in collect_article_files():
+    for path_str in article_files:
         try:
-            path.unlink()
-            removed_files.append(path.as_posix())
+            os.unlink(path_str)
+            removed_files.append(path_str.replace(os.sep, "/"))
         except Exception:
             continue
     return updated_files, removed_files
@@ -1014,32 +1262,38 @@ def cleanup_articles(slug_map: dict[str, str]) -> tuple[list[str], list[str]]:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Sync blog single page and clean old article files.")
     parser.add_argument("--refresh", action="store_true", help="Forcar sincronizacao do legado.")
+    parser.add_argument("--force", action="store_true", help="Ignorar o cache de HTML em disco.")
     args = parser.parse_args()
 
-    article_files = collect_article_files()
-    slug_map = {slug_from_article_path(path): f"blog.html#post-{slug_from_article_path(path)}" for path in article_files}
+    global FORCE_FETCH
+    FORCE_FETCH = args.force
+
+    article_files, text_files = walk_once()
+    slug_map = {
+        (slug := slug_from_article_path(path_str)): f"blog.html#post-{slug}"
+        for path_str in article_files
+    }
 
     posts, report = load_or_sync_posts(args.refresh, slug_map)
     posts = process_existing_posts(posts, slug_map, report)
 
     POSTS_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
-    POSTS_JSON_PATH.write_text(json.dumps(posts, indent=2, ensure_ascii=False), encoding="utf-8")
+    atomic_write_bytes(POSTS_JSON_PATH, dump_json_bytes(posts))
 
     update_blog_html(posts)
     update_sitemap()
 
-    updated_files, removed_files = cleanup_articles(slug_map)
+    updated_files, removed_files = cleanup_articles(slug_map, article_files, text_files)
 
-    remaining_articles = collect_article_files()
     report_payload = {
         "totalPosts": len(posts),
         "totalImagesDownloaded": report["totalImagesDownloaded"],
         "articleHtmlFilesRemovedCount": len(removed_files),
         "removedFiles": removed_files,
         "brokenInternalRefsFixed": updated_files,
-        "remainingArticleHtmlFiles": len(remaining_articles),
+        "remainingArticleHtmlFiles": len(article_files) - len(removed_files),
     }
-    REPORT_PATH.write_text(json.dumps(report_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    atomic_write_bytes(REPORT_PATH, dump_json_bytes(report_payload))
 
 
 if __name__ == "__main__":